@@ -1,14 +1,13 @@
 import streamlit as st
 import random
-import requests
+from spellbee_core import find_good_set, letter_mask, submit_word_logic, words_for_puzzle
 
 # -------------------------
 # CONFIG & THEME
 # -------------------------
 st.set_page_config(page_title="Spell Bee", layout="centered")
 
-st.markdown(
-    """
+_CSS = """
     <style>
     :root { color-scheme: light; }
     html, body, .stApp, .main, .block-container {
@@ -48,65 +47,25 @@ st.markdown(
         color: white !important;
     }
     </style>
-    """,
-    unsafe_allow_html=True,
-)
-
-# -------------------------
-# GAME SETTINGS
-# -------------------------
-WORDS_RAW_URL = "https://raw.githubusercontent.com/dwyl/english-words/master/words_alpha.txt"
-SCORING = {4: 2, 5: 4, 6: 6, 7: 8}
-MAX_WORDS = 3
-
-def points_for_length(n):
-    return 0 if n < 4 else SCORING.get(n, 8)
-
-# -------------------------
-# LOAD WORD LIST
-# -------------------------
-@st.cache_data
-def load_words():
-    try:
-        r = requests.get(WORDS_RAW_URL, timeout=5)
-        words = [w.strip().lower() for w in r.text.splitlines() if w.isalpha()]
-    except:
-        words = ["planet", "general", "lantern", "pattern", "explain", "related", "partner",
-                 "garden", "danger", "ranged", "learning", "triangle", "integral",
-                 "altering", "orange", "granola"]
-    return [w for w in words if len(w) >= 4]
+    """
 
-# -------------------------
-# GENERATE LETTERS
-# -------------------------
-def find_good_set(word_list):
-    pangrams = [w for w in word_list if len(set(w)) == 7 and len(w) >= 7]
-    random.shuffle(pangrams)
-    for cand in pangrams:
-        letters = sorted(set(cand))
-        for center in letters:
-            valid = [w for w in word_list if set(w) <= set(letters) and center in w]
-            if len(valid) >= 10:
-                outer = [l for l in letters if l != center]
-                return letters, center, valid, random.sample(outer, len(outer))
-    letters = list("planetg")
-    center = letters[0]
-    valid = [w for w in word_list if set(w) <= set(letters) and center in w]
-    outer = [l for l in letters if l != center]
-    return letters, center, valid, random.sample(outer, len(outer))
+st.markdown(_CSS, unsafe_allow_html=True)
 
 # -------------------------
 # INIT GAME
 # -------------------------
 def init_game():
-    word_list = load_words()
-    letters, center, valid, outer_order = find_good_set(word_list)
+    letters, center = find_good_set()
+    outer = [l for l in letters if l != center]
+    random.shuffle(outer)
     st.session_state.letters = letters
     st.session_state.center = center
-    st.session_state.valid_words = valid
-    st.session_state.outer_order = outer_order
+    st.session_state.letters_mask = letter_mask(letters)
+    st.session_state.center_mask = letter_mask(center)
+    st.session_state.outer_order = outer
     st.session_state.current_word = ""
     st.session_state.words_entered = []
+    st.session_state.words_entered_set = set()
     st.session_state.score = 0
     st.session_state.messages = []
     st.session_state.game_over = False
@@ -120,30 +79,12 @@ if "letters" not in st.session_state:
 def append_letter(l): st.session_state.current_word += l
 def backspace(): st.session_state.current_word = st.session_state.current_word[:-1]
 def clear_word(): st.session_state.current_word = ""
-def reshuffle():
-    outer = [l for l in st.session_state.letters if l != st.session_state.center]
-    st.session_state.outer_order = random.sample(outer, len(outer))
+def reshuffle(): random.shuffle(st.session_state.outer_order)
 def restart(): init_game()
+def exit_game(): st.session_state.game_over = True
 
 def submit_word():
-    word = st.session_state.current_word.lower()
-    if len(word) < 4:
-        st.session_state.messages.append("Word is too short")
-    elif st.session_state.center not in word:
-        st.session_state.messages.append("Middle letter is not included")
-    elif any(ch not in st.session_state.letters for ch in word):
-        st.session_state.messages.append("Word contains invalid letters")
-    elif word not in load_words():
-        st.session_state.messages.append("Word not found in dictionary")
-    elif word in st.session_state.words_entered:
-        st.session_state.messages.append("You already used that word")
-    else:
-        pts = points_for_length(len(word))
-        st.session_state.score += pts
-        st.session_state.words_entered.append(word)
-        st.session_state.messages.append(f"Accepted! +{pts} points for '{word}'")
-        if len(st.session_state.words_entered) >= MAX_WORDS:
-            st.session_state.game_over = True
+    submit_word_logic(st.session_state, st.session_state.current_word.lower())
     st.session_state.current_word = ""
 
 # -------------------------
@@ -162,8 +103,9 @@ for m in st.session_state.messages[-3:]:
 
 if st.session_state.game_over:
     st.success(f"Game over! Final score: {st.session_state.score}")
-    st.write("Possible words:", ", ".join(st.session_state.valid_words[:20]))
-    if st.button("Restart Game"): restart()
+    valid = words_for_puzzle(st.session_state.letters_mask, st.session_state.center)
+    st.write("Possible words:", ", ".join(valid[:20]))
+    st.button("Restart Game", on_click=restart)
     st.stop()
 
 # -------------------------
@@ -176,10 +118,6 @@ def letter_btn(letter, css_class, key):
     if letter:
         if st.button(letter.upper(), key=key, use_container_width=False):
             append_letter(letter)
-        st.markdown(
-            f"<style>div[data-testid='stButton'][key='{key}'] button {{ background-color: inherit; }}</style>",
-            unsafe_allow_html=True
-        )
 
 # Row 1 (top 2)
 cols = st.columns([2,1,1,2])
@@ -206,15 +144,14 @@ st.session_state.current_word = st.text_input(
 )
 
 col1, col2, col3, col4 = st.columns(4)
-if col1.button("⟲ Reshuffle"): reshuffle()
+col1.button("⟲ Reshuffle", on_click=reshuffle)
 if col2.button("⌫ Backspace"): backspace()
 if col3.button("Clear"): clear_word()
 if col4.button("Submit Word"): submit_word()
 
-# Restart / Exit
+# Restart / Exit (callbacks run before the rerun, so the new state is drawn straight away)
 col1, col2 = st.columns(2)
-if col1.button("Restart Game"): restart()
-if col2.button("Exit"):
-    st.session_state.game_over = True
+col1.button("Restart Game", on_click=restart)
+col2.button("Exit", on_click=exit_game)
 
 
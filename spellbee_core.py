@@ -0,0 +1,176 @@
+import streamlit as st
+import bisect
+import os
+import random
+import string
+import numpy as np
+import requests
+
+# -------------------------
+# GAME SETTINGS
+# -------------------------
+WORDS_RAW_URL = "https://raw.githubusercontent.com/dwyl/english-words/master/words_alpha.txt"
+WORDS_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "words_cache.txt")
+SCORING = (0, 0, 0, 0, 2, 4, 6, 8)  # points indexed by word length; longer words score as 7
+MAX_WORDS = 3
+MIN_VALID_WORDS = 10
+MIN_DICTIONARY_WORDS = 10000  # the real list gives ~100k; fewer means an error page or a cut-off body
+FALLBACK_WORDS = ("planet", "general", "lantern", "pattern", "explain", "related", "partner",
+                  "garden", "danger", "ranged", "learning", "triangle", "integral",
+                  "altering", "orange", "granola")
+
+def points_for_length(n):
+    return SCORING[n] if n < len(SCORING) else SCORING[-1]
+
+# -------------------------
+# LOAD WORD LIST
+# -------------------------
+def _parse_words(data):
+    # bytes.isalpha() is true only for ASCII letters, so no decode is needed to filter.
+    # A puzzle has 7 letters, so words using more than 7 distinct ones can never be played.
+    return [w.decode("ascii") for w in data.lower().split()
+            if len(w) >= 4 and w.isalpha() and len(set(w)) <= 7]
+
+def _fetch_words():
+    # A previous download skips the network. It still goes through the filter,
+    # so a cache written by an older version, or damaged on disk, is not
+    # trusted as-is; an unreadable or implausible one is downloaded again.
+    try:
+        with open(WORDS_CACHE_PATH, "rb") as f:
+            words = _parse_words(f.read())
+        if len(words) >= MIN_DICTIONARY_WORDS:
+            return words
+    except OSError:
+        pass
+    try:
+        r = requests.get(WORDS_RAW_URL, timeout=5)
+        r.raise_for_status()
+        words = _parse_words(r.content)
+    except:
+        words = []
+    # Never persist a response that is not plausibly the real list
+    if len(words) < MIN_DICTIONARY_WORDS:
+        return [w for w in FALLBACK_WORDS if len(w) >= 4 and len(set(w)) <= 7]
+    try:
+        tmp_path = WORDS_CACHE_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="ascii") as f:
+            f.write("\n".join(words))
+        os.replace(tmp_path, WORDS_CACHE_PATH)
+    except OSError:
+        pass
+    return words
+
+# cache_resource hands back the same object on every call; cache_data would
+# unpickle a fresh copy of the whole dictionary each time it is used.
+@st.cache_resource(show_spinner="Loading word list...")
+def load_words_list():
+    words = _fetch_words()
+    words.sort()  # is_word() binary-searches this list
+    return words
+
+# Looked up in the sorted list rather than a separate set, so the
+# dictionary is held in memory only once
+def is_word(word):
+    words = load_words_list()
+    i = bisect.bisect_left(words, word)
+    return i < len(words) and words[i] == word
+
+# -------------------------
+# WORD INDEX
+# -------------------------
+# Bits 0-25 are a-z; any other character sets bit 26, which no puzzle allows
+def letter_mask(letters):
+    mask = 0
+    for c in set(letters):
+        i = ord(c) - 97
+        mask |= 1 << (i if 0 <= i < 26 else 26)
+    return mask
+
+@st.cache_resource(show_spinner="Indexing words...")
+def build_word_index():
+    words = load_words_list()
+    words_arr = np.array(words, dtype=object)
+    # One row of zero-padded ASCII codes per word, so the masks are built
+    # with array ops instead of a Python loop over every character
+    fixed = np.array(words, dtype="S")
+    chars = fixed.view(np.uint8).reshape(len(fixed), fixed.itemsize).astype(np.uint32)
+    bits = np.where(chars != 0, np.uint32(1) << (chars - 97), np.uint32(0))
+    masks = np.bitwise_or.reduce(bits, axis=1)
+    has_letter = {c: (masks & np.uint32(1 << i)) != 0 for i, c in enumerate(string.ascii_lowercase)}
+    return masks, has_letter, words_arr
+
+# Row k marks which of a pangram's 7 (sorted) letters are in its k-th submask
+SUBMASK_LETTERS = ((np.arange(128)[:, None] >> np.arange(7)) & 1).astype(np.uint32)
+PANGRAM_BLOCK = 2048
+
+# Only letter sets that make a playable puzzle are kept, each with the first
+# center (in letter order) that yields MIN_VALID_WORDS words. Word counts for
+# every set and center are worked out here once: a word fits a puzzle exactly
+# when its mask is a submask of the pangram's, so the counts are sums over
+# the 128 submasks of each pangram. Returns the pangram masks and the bit
+# position of each one's center.
+@st.cache_resource(show_spinner="Building puzzles...")
+def load_pangram_index():
+    masks, _, _ = build_word_index()
+    pangram_masks = np.unique(masks[np.bitwise_count(masks) == 7])
+    if not len(pangram_masks):
+        return pangram_masks, np.zeros(0, dtype=np.intp)
+    mask_values, mask_counts = np.unique(masks, return_counts=True)
+    # Bit positions of each pangram's 7 letters, in alphabetical order
+    letter_pos = np.nonzero((pangram_masks[:, None] >> np.arange(26, dtype=np.uint32)) & 1)[1].reshape(-1, 7)
+    letter_bits = np.uint32(1) << letter_pos.astype(np.uint32)
+    # Pangrams are taken a block at a time so the 128-per-pangram temporaries
+    # stay a few MB instead of growing with the whole dictionary
+    playable = np.empty((len(pangram_masks), 7), dtype=bool)
+    for start in range(0, len(pangram_masks), PANGRAM_BLOCK):
+        submasks = letter_bits[start:start + PANGRAM_BLOCK] @ SUBMASK_LETTERS.T
+        pos = np.searchsorted(mask_values, submasks).clip(max=len(mask_values) - 1)
+        submask_counts = np.where(mask_values[pos] == submasks, mask_counts[pos], 0)
+        playable[start:start + PANGRAM_BLOCK] = submask_counts @ SUBMASK_LETTERS >= MIN_VALID_WORDS
+    keep = playable.any(axis=1)
+    centers = letter_pos[keep][np.arange(np.count_nonzero(keep)), playable[keep].argmax(axis=1)]
+    return pangram_masks[keep], centers
+
+# -------------------------
+# GENERATE LETTERS
+# -------------------------
+def mask_letters(mask):
+    return tuple(c for i, c in enumerate(string.ascii_lowercase) if mask >> i & 1)
+
+def words_for_puzzle(letters_mask, center):
+    masks, has_letter, words_arr = build_word_index()
+    # Only the few words spelled from these letters are checked for the center
+    subset = np.flatnonzero((masks & ~np.uint32(letters_mask)) == 0)
+    return tuple(words_arr[subset[has_letter[center][subset]]])
+
+def find_good_set():
+    pangram_masks, centers = load_pangram_index()
+    if len(pangram_masks):
+        i = random.randrange(len(pangram_masks))
+        return mask_letters(int(pangram_masks[i])), string.ascii_lowercase[centers[i]]
+    letters = tuple("planetg")
+    return letters, letters[0]
+
+# -------------------------
+# SUBMIT WORD
+# -------------------------
+def submit_word_logic(state, word):
+    word_mask = letter_mask(word)
+    if len(word) < 4:
+        state.messages.append("Word is too short")
+    elif not word_mask & state.center_mask:
+        state.messages.append("Middle letter is not included")
+    elif word_mask & ~state.letters_mask:
+        state.messages.append("Word contains invalid letters")
+    elif not is_word(word):
+        state.messages.append("Word not found in dictionary")
+    elif word in state.words_entered_set:
+        state.messages.append("You already used that word")
+    else:
+        pts = points_for_length(len(word))
+        state.score += pts
+        state.words_entered.append(word)
+        state.words_entered_set.add(word)
+        state.messages.append(f"Accepted! +{pts} points for '{word}'")
+        if len(state.words_entered) >= MAX_WORDS:
+            state.game_over = True